@@ -9,6 +9,10 @@ This keeps noon aligned with the sun locally, without needing time zones or DST.
 import math
 from datetime import date, datetime, time, timedelta, timezone
 from functools import lru_cache
+from typing import Optional
+
+# Bound once, saves the attribute lookup in the trig-heavy functions below.
+_sin, _cos, _radians = math.sin, math.cos, math.radians
 
 # Constants from NOAA Technical Report
 SOLAR_RADIUS = 0.26667  # Degrees
@@ -20,87 +24,163 @@ SUNRISE_SUNSET = -(SOLAR_RADIUS + REFRACTION)  # -0.8333° for sunrise/sunset
 FIXED_HOURS = 23
 FIXED_SEC = FIXED_HOURS * 3600  # 82800 seconds fixed
 TOTAL_CTU_SEC = 86400  # CTU day length in seconds
+_FIXED_US = FIXED_SEC * 1_000_000
+_TOTAL_CTU_US = TOTAL_CTU_SEC * 1_000_000
 
+_ZERO = timedelta(0)
+_MICROSECOND = timedelta(microseconds=1)
 
-@lru_cache(maxsize=365)
-def calc_noon_utc(longitude: float, dt: datetime) -> datetime:
+# Solar window of the last now() call: (longitude, solar_midnight, T_solar).
+_now_ctx: Optional[tuple[float, int, int]] = None
+
+
+@lru_cache(maxsize=256)
+def _jan1_ordinal(year: int) -> int:
+    """Proleptic ordinal of January 1st of the given year."""
+    return date(year, 1, 1).toordinal()
+
+
+def _day_of_year(ordinal: int) -> int:
+    """Day of year (1-366) of the given proleptic ordinal."""
+    return ordinal - _jan1_ordinal(date.fromordinal(ordinal).year) + 1
+
+
+def _eot_minutes(n: int) -> float:
     """
-    Calculate UTC-aware solar noon from approximate astronomical formulas.
+    Equation of time in minutes for day of year n.
     The equation of time approximates the discrepancy between sundial time and clock time.
     """
-    n = dt.timetuple().tm_yday
-    B = math.radians(360 / 365.2422 * (n - 81))
-    eot = (
-        9.87 * math.sin(2 * B)
-        - 7.53 * math.cos(B)
-        - 1.5 * math.sin(B)
-        + 0.21 * math.cos(2 * B)
+    B = _radians(360 / 365.2422 * (n - 81))
+    sin_B, cos_B = _sin(B), _cos(B)
+    # Double-angle identities: sin(2B) = 2 sin(B) cos(B), cos(2B) = 1 - 2 sin²(B)
+    return (
+        9.87 * 2 * sin_B * cos_B
+        - 7.53 * cos_B
+        - 1.5 * sin_B
+        + 0.21 * (1 - 2 * sin_B * sin_B)
     )
-    return datetime(dt.year, dt.month, dt.day, tzinfo=timezone.utc) + timedelta(
-        seconds=(12 - (longitude / 15 + eot / 60)) * 3600
+
+
+# The approximation only depends on the day of year, so one table covers every year.
+_EOT_SEC = tuple(_eot_minutes(n) * 60 for n in range(367))  # index 0 is unused
+
+
+def _to_micros(dt: datetime) -> int:
+    """Microseconds since proleptic ordinal 0 (the day before 0001-01-01) of a datetime."""
+    return (
+        dt.toordinal() * 86_400_000_000
+        + dt.hour * 3_600_000_000
+        + dt.minute * 60_000_000
+        + dt.second * 1_000_000
+        + dt.microsecond
     )
 
 
-def utc_to_ctu(utc: datetime, longitude: float) -> tuple[time, date]:
-    """
-    Convert UTC to CTU using an asymmetrical midnight hour model.
+def _micros_to_time(micros: int) -> time:
+    """Split microseconds after midnight into a time."""
+    hours, rem = divmod(micros, 3_600_000_000)
+    minutes, rem = divmod(rem, 60_000_000)
+    seconds, micro = divmod(rem, 1_000_000)
+    return time(hours, minutes, seconds, micro)
 
-    In this model, the first 23 CTU hours (82800 seconds) are mapped directly
-    1:1 from solar time (measured from solar midnight). The remaining part of the
-    solar day is scaled into exactly 3600 CTU seconds (the variable midnight hour).
 
-    Returns a tuple (CTU time, reference date), where the reference day is that
-    corresponding to the computed solar noon.
+def _from_micros(micros: int) -> datetime:
+    """Inverse of _to_micros, as a UTC-aware datetime."""
+    ordinal, rem = divmod(micros, 86_400_000_000)
+    return datetime.combine(
+        date.fromordinal(ordinal), _micros_to_time(rem), tzinfo=timezone.utc
+    )
+
+
+def calc_noon_utc(longitude: float, dt: datetime) -> datetime:
+    """Calculate UTC-aware solar noon from approximate astronomical formulas."""
+    noon, _, _ = _day_ctx(longitude, dt.toordinal())
+    return _from_micros(noon)
+
+
+@lru_cache(maxsize=4096)
+def _day_base(ordinal: int) -> tuple[float, float]:
     """
-    if utc.utcoffset() != timedelta(0):
-        raise ValueError("UTC datetime required")
+    Longitude-independent part of the solar window of the given proleptic ordinal.
 
-    # Determine the correct solar window by testing candidate days.
-    def window_for_day(base_day: date):
-        noon = calc_noon_utc(
-            longitude, datetime.combine(base_day, time(), tzinfo=timezone.utc)
-        )
-        next_noon = calc_noon_utc(longitude, noon + timedelta(days=1))
-        T_solar = (next_noon - noon).total_seconds()
-        solar_midnight = noon - timedelta(seconds=T_solar / 2)
-        return noon, solar_midnight, T_solar
-
-    today = utc.date()
-    for day_offset in [-1, 0, 1]:
-        base_day = today + timedelta(days=day_offset)
-        ref_noon, solar_midnight, T_solar = window_for_day(base_day)
-        end = solar_midnight + timedelta(seconds=T_solar)
-        if solar_midnight <= utc < end:
-            break
-    else:
-        # In 1 000 000 second-roundtrips there are 38 pathological ones that fail.
-        # This is likely caused by a EoT discontinuity or a cumulative timing effect causing an intersection gap.
-        # It's also not a floating point rounding issue, so there is no easy fix not worth further complicating the code.
-        # So we cheat: try previous or next second and reuse result, limiting the error to ~1 second.
-        return utc_to_ctu(utc - timedelta(seconds=1), longitude)
+    Returns the EoT in seconds of that day and of the next one.
+    """
+    return _EOT_SEC[_day_of_year(ordinal)], _EOT_SEC[_day_of_year(ordinal + 1)]
 
-    ref_day = ref_noon.date()
 
-    elapsed = (utc - solar_midnight).total_seconds()
+@lru_cache(maxsize=4096)
+def _day_ctx(longitude: float, ordinal: int) -> tuple[int, int, int]:
+    """
+    Solar window of the day with the given proleptic ordinal.
 
+    Returns (noon, solar_midnight, T_solar) in integer microseconds, the first two
+    on the _to_micros scale.
+    """
+    eot, eot_next = _day_base(ordinal)
+    # Round each noon as a whole, so it stays on the microsecond calc_noon_utc always gave.
+    shift = 43200 - longitude * 240
+    noon = ordinal * 86_400_000_000 + round((shift - eot) * 1_000_000)
+    next_noon = (ordinal + 1) * 86_400_000_000 + round((shift - eot_next) * 1_000_000)
+    T_solar = next_noon - noon
+    # Halve through float seconds like the timedelta arithmetic this replaces,
+    # odd microsecond days then round the same way as they always did.
+    half = timedelta(seconds=T_solar / 2_000_000) // _MICROSECOND
+    return noon, noon - half, T_solar
+
+
+def _find_window(longitude: float, utc: int) -> tuple[int, int, int]:
+    """
+    Locate the solar window containing utc (microseconds, see _to_micros).
+
+    Returns (ordinal of the window's day, elapsed microseconds since its solar midnight, T_solar).
+    """
+    ordinal = utc // 86_400_000_000
+    # Determine the correct solar window by testing candidate days.
+    for day_offset in (-1, 0, 1):
+        _, solar_midnight, T_solar = _day_ctx(longitude, ordinal + day_offset)
+        elapsed = utc - solar_midnight
+        if 0 <= elapsed < T_solar:
+            return ordinal + day_offset, elapsed, T_solar
+    # In 1 000 000 second-roundtrips there are 38 pathological ones that fail.
+    # This is likely caused by a EoT discontinuity or a cumulative timing effect causing an intersection gap.
+    # It's also not a floating point rounding issue, so there is no easy fix not worth further complicating the code.
+    # So we cheat: try previous or next second and reuse result, limiting the error to ~1 second.
+    return _find_window(longitude, utc - 1_000_000)
+
+
+def _ctu_time(elapsed: int, T_solar: int) -> time:
+    """CTU time for microseconds elapsed since solar midnight in a window of T_solar."""
     # For elapsed time within the first 23 fixed hours, CTU time equals elapsed time.
-    if elapsed <= FIXED_SEC:
-        ctu_sec = elapsed
+    if elapsed <= _FIXED_US:
+        ctu_us = elapsed
     else:
-        # Otherwise, map the remaining elapsed seconds linearly into 3600 CTU seconds.
-        extra = elapsed - FIXED_SEC
+        # Otherwise, map the remaining elapsed time linearly into 3600 CTU seconds.
+        extra = elapsed - _FIXED_US
         variable_length = (
-            T_solar - FIXED_SEC
-        )  # Actual solar seconds in the variable midnight hour.
-        ctu_sec = FIXED_SEC + (extra / variable_length) * 3600
+            T_solar - _FIXED_US
+        )  # Actual solar microseconds in the variable midnight hour.
+        ctu_us = _FIXED_US + round(extra * 3_600_000_000 / variable_length)
 
     # Normalize into [0, 86400) if needed.
-    ctu_sec %= TOTAL_CTU_SEC
-    hours, rem = divmod(int(ctu_sec), 3600)
-    minutes, seconds = divmod(rem, 60)
-    micro = round((ctu_sec - int(ctu_sec)) * 1_000_000)
+    return _micros_to_time(ctu_us % _TOTAL_CTU_US)
+
+
+def utc_to_ctu(utc: datetime, longitude: float) -> tuple[time, date]:
+    """
+    Convert UTC to CTU using an asymmetrical midnight hour model.
 
-    return time(hours, minutes, seconds, micro), ref_day
+    In this model, the first 23 CTU hours (82800 seconds) are mapped directly
+    1:1 from solar time (measured from solar midnight). The remaining part of the
+    solar day is scaled into exactly 3600 CTU seconds (the variable midnight hour).
+
+    Returns a tuple (CTU time, reference date), where the reference day is that
+    corresponding to the computed solar noon.
+    """
+    if utc.utcoffset() != _ZERO:
+        raise ValueError("UTC datetime required")
+
+    ordinal, elapsed, T_solar = _find_window(longitude, _to_micros(utc))
+    return _ctu_time(elapsed, T_solar), date.fromordinal(ordinal)
 
 
 def ctu_to_utc(ctu: time, ref_day: date, longitude: float) -> datetime:
@@ -111,32 +191,39 @@ def ctu_to_utc(ctu: time, ref_day: date, longitude: float) -> datetime:
     For CTU seconds above or equal to 82800, the inverse scaling recovers the actual
     solar seconds in the variable midnight hour.
     """
-    ref_noon = calc_noon_utc(
-        longitude,
-        datetime(ref_day.year, ref_day.month, ref_day.day, tzinfo=timezone.utc),
+    _, solar_midnight, T_solar = _day_ctx(longitude, ref_day.toordinal())
+
+    # Compute total CTU microseconds from the input CTU time.
+    ctu_us = (
+        ctu.hour * 3_600_000_000
+        + ctu.minute * 60_000_000
+        + ctu.second * 1_000_000
+        + ctu.microsecond
     )
-    next_noon = calc_noon_utc(longitude, ref_noon + timedelta(days=1))
-    T_solar = (next_noon - ref_noon).total_seconds()
-    solar_midnight = ref_noon - timedelta(seconds=T_solar / 2)
-
-    # Compute total CTU seconds from the input CTU time.
-    ctu_sec = ctu.hour * 3600 + ctu.minute * 60 + ctu.second + ctu.microsecond / 1e6
 
-    if ctu_sec <= FIXED_SEC:
-        elapsed = ctu_sec
+    if ctu_us <= _FIXED_US:
+        elapsed = ctu_us
     else:
-        extra_ctu = ctu_sec - FIXED_SEC
-        variable_length = T_solar - FIXED_SEC
-        extra = (extra_ctu / 3600) * variable_length
-        elapsed = FIXED_SEC + extra
+        extra_ctu = ctu_us - _FIXED_US
+        variable_length = T_solar - _FIXED_US
+        extra = round(extra_ctu * variable_length / 3_600_000_000)
+        elapsed = _FIXED_US + extra
 
-    utc = solar_midnight + timedelta(seconds=elapsed)
-    return utc.astimezone(timezone.utc)
+    return _from_micros(solar_midnight + elapsed)
 
 
 def now(longitude: float) -> time:
     """Return the current CTU time using the asymmetric midnight model."""
-    return utc_to_ctu(datetime.now(timezone.utc), longitude)[0]
+    global _now_ctx
+    utc = _to_micros(datetime.now(timezone.utc))
+    ctx = _now_ctx
+    # Consecutive calls mostly land in the same solar window, so skip the search.
+    if ctx is not None and ctx[0] == longitude and 0 <= utc - ctx[1] < ctx[2]:
+        return _ctu_time(utc - ctx[1], ctx[2])
+    ordinal, elapsed, T_solar = _find_window(longitude, utc)
+    _, solar_midnight, _ = _day_ctx(longitude, ordinal)
+    _now_ctx = longitude, solar_midnight, T_solar
+    return _ctu_time(elapsed, T_solar)
 
 
 def roundtrip_test(longitude: float, utc_now: datetime) -> float:
@@ -158,12 +245,14 @@ def julian_date(dt: datetime) -> float:
     y = dt.year + 4800 - a
     m = dt.month + 12 * a - 3
     jdn = dt.day + (153 * m + 2) // 5 + 365 * y + y // 4 - y // 100 + y // 400 - 32045
-    frac = (
-        (dt.hour - 12) / 24
-        + dt.minute / 1440
-        + dt.second / 86400
-        + dt.microsecond / 86400e6
+    # Sum the time of day as exact integer microseconds, then divide once.
+    micros = (
+        dt.hour * 3_600_000_000
+        + dt.minute * 60_000_000
+        + dt.second * 1_000_000
+        + dt.microsecond
     )
+    frac = (micros - 43_200_000_000) / 86_400_000_000
     return jdn + frac
 
 
@@ -176,27 +265,29 @@ def solar_coordinates(jd: float) -> tuple:
     L = (280.46646 + 36000.76983 * T + 0.0003032 * T**2) % 360
     M = (357.52911 + 35999.05029 * T - 0.0001537 * T**2) % 360
     e = 0.016708634 - 0.000042037 * T - 0.0000001267 * T**2
+    L_r, M_r = _radians(L), _radians(M)
+    sin_M, sin_2M = _sin(M_r), _sin(2 * M_r)
 
     # Equation of center
     C = (
-        (1.914602 - 0.004817 * T - 0.000014 * T**2) * math.sin(math.radians(M))
-        + (0.019993 - 0.000101 * T) * math.sin(2 * math.radians(M))
-        + 0.000289 * math.sin(3 * math.radians(M))
+        (1.914602 - 0.004817 * T - 0.000014 * T**2) * sin_M
+        + (0.019993 - 0.000101 * T) * sin_2M
+        + 0.000289 * _sin(3 * M_r)
     )
 
     # True solar longitude and declination
     λ = (L + C) % 360
-    δ = math.degrees(math.asin(math.sin(math.radians(λ)) * 0.3977895))
+    δ = math.degrees(math.asin(_sin(_radians(λ)) * 0.3977895))
 
     # Equation of time (minutes)
     ε = 23.4393 - 0.01300 * T
-    y = math.tan(math.radians(ε / 2)) ** 2
+    y = math.tan(_radians(ε / 2)) ** 2
     eot = (
-        y * math.sin(2 * math.radians(L))
-        - 2 * e * math.sin(math.radians(M))
-        + 4 * e * y * math.sin(math.radians(M)) * math.cos(2 * math.radians(L))
-        - 0.5 * y**2 * math.sin(4 * math.radians(L))
-        - 1.25 * e**2 * math.sin(2 * math.radians(M))
+        y * _sin(2 * L_r)
+        - 2 * e * sin_M
+        + 4 * e * y * sin_M * _cos(2 * L_r)
+        - 0.5 * y**2 * _sin(4 * L_r)
+        - 1.25 * e**2 * sin_2M
     )
     eot = math.degrees(eot) * 4  # Convert radians to minutes
 
@@ -205,12 +296,12 @@ def solar_coordinates(jd: float) -> tuple:
 
 def hour_angle(lat: float, dec: float, elev: float = CIVIL_TWILIGHT) -> float:
     """Calculate sun hour angle for target elevation (degrees)."""
-    lat_rad = math.radians(lat)
-    dec_rad = math.radians(dec)
-    elev_rad = math.radians(elev)
+    lat_rad = _radians(lat)
+    dec_rad = _radians(dec)
+    elev_rad = _radians(elev)
 
-    cos_ha = (math.sin(elev_rad) - math.sin(lat_rad) * math.sin(dec_rad)) / (
-        math.cos(lat_rad) * math.cos(dec_rad)
+    cos_ha = (_sin(elev_rad) - _sin(lat_rad) * _sin(dec_rad)) / (
+        _cos(lat_rad) * _cos(dec_rad)
     )
 
     if cos_ha < -1:
@@ -220,21 +311,18 @@ def hour_angle(lat: float, dec: float, elev: float = CIVIL_TWILIGHT) -> float:
 
 def dawn_dusk(lat: float, lon: float, date: datetime) -> tuple[datetime, datetime]:
     """Dawn/dusk in UTC."""
-    noon_utc = calc_noon_utc(lon, date).replace(tzinfo=timezone.utc)
+    noon, _, _ = _day_ctx(lon, date.toordinal())
+    noon_utc = _from_micros(noon)
 
     # Solar position at noon
     jd = julian_date(noon_utc)
     dec, eot = solar_coordinates(jd)
 
-    # Hour angles
+    # Hour angles, dawn and dusk lie symmetrically around noon.
     ha = hour_angle(lat, dec)
-    dawn_offset = timedelta(minutes=-(ha * 4 + eot))
-    dusk_offset = timedelta(minutes=+(ha * 4 + eot))
-
-    dawn = noon_utc + dawn_offset
-    dusk = noon_utc + dusk_offset
+    offset = timedelta(minutes=ha * 4 + eot)
 
-    return dawn, dusk
+    return noon_utc - offset, noon_utc + offset
 
 
 if __name__ == "__main__":
@@ -1,9 +1,11 @@
-from datetime import datetime, timezone
+from datetime import date, datetime, time, timedelta, timezone
 
 from hypothesis import strategies as st
 
 from ctu_time import (
     calc_noon_utc,
+    ctu,
+    ctu_to_utc,
     utc_to_ctu,
 )
 
@@ -34,7 +36,73 @@ def test_polar_longitude():
     assert 0 <= ctu_time[0].hour <= 23, "Polar longitude hour invalid"
 
 
+def test_date_line_roundtrip():
+    """Should roundtrip at ±180° when solar noon falls on the neighbouring UTC date"""
+    # Positive EoT in November puts noon at 180° before 00:00 UTC,
+    # negative EoT in February puts noon at -180° after 24:00 UTC.
+    for longitude, start in (
+        (180.0, datetime(2025, 11, 1, tzinfo=timezone.utc)),
+        (-180.0, datetime(2025, 2, 1, tzinfo=timezone.utc)),
+    ):
+        for minutes in range(0, 48 * 60, 7):
+            utc_time = start + timedelta(minutes=minutes)
+            back = ctu_to_utc(*utc_to_ctu(utc_time, longitude), longitude)
+            assert back == utc_time, f"Date line roundtrip failed at {utc_time}"
+
+
 def test_leap_year():
     """Feb 29 should produce valid CTU time"""
     noon = calc_noon_utc(0.0, datetime(2024, 2, 29))
     assert noon.month == 2 and noon.day == 29, "Leap year handling failed"
+
+
+def test_noon_fractional_longitude():
+    """Solar noon should round to the same microsecond for any longitude"""
+    noon = calc_noon_utc(9.18291713, datetime(2025, 4, 15))
+    assert noon == datetime(2025, 4, 15, 11, 23, 22, 211344, tzinfo=timezone.utc)
+    noon = calc_noon_utc(-122.41941551, datetime(2025, 3, 15))
+    assert noon == datetime(2025, 3, 15, 20, 19, 7, 390113, tzinfo=timezone.utc)
+
+
+def test_microsecond_rounding():
+    """Fractions rounding up to a full second should carry into the seconds"""
+    # Scaled into the midnight hour, this lands within half a microsecond of 23:00:01.
+    utc_time = datetime(2025, 1, 1, 22, 26, 59, 267671, tzinfo=timezone.utc)
+    ctu_time = utc_to_ctu(utc_time, 9.1829)
+    assert ctu_time == (time(23, 0, 1), date(2025, 1, 1)), "Microsecond rounding failed"
+
+
+def test_now_cache(monkeypatch):
+    """now() should match utc_to_ctu while reusing, expiring and rekeying its window"""
+    clock = []
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return clock[-1]
+
+    monkeypatch.setattr(ctu, "datetime", FrozenDatetime)
+    monkeypatch.setattr(ctu, "_now_ctx", None)
+
+    longitude = 9.1829
+    day = date(2025, 6, 1)
+    last_second = ctu_to_utc(time(23, 59, 59), day, longitude)
+
+    def check(utc_time, lon):
+        clock.append(utc_time)
+        expected = utc_to_ctu(utc_time, lon)[0]
+        assert ctu.now(lon) == expected, f"now() wrong at {utc_time}"
+
+    # Inside a window: the second call is served from the cached window.
+    check(ctu_to_utc(time(12), day, longitude), longitude)
+    cached = ctu._now_ctx
+    check(last_second, longitude)
+    assert ctu._now_ctx is cached, "Window cache was not reused"
+
+    # Just past the following solar midnight the cached window has expired.
+    check(last_second + timedelta(seconds=2), longitude)
+    assert ctu._now_ctx != cached, "Window cache did not expire"
+
+    # A different longitude must not reuse the window of the previous one.
+    check(last_second + timedelta(seconds=2), 0.0)
+    assert ctu._now_ctx[0] == 0.0, "Window cache ignored the longitude"